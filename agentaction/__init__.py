@@ -1,5 +1,7 @@
 from .main import (
     compose_action_prompt,
+    compile_prompt,
+    render_prompt,
     get_actions,
     add_to_action_history,
     get_action_history,
@@ -13,11 +15,14 @@ from .main import (
     get_action,
     remove_action,
     import_actions,
-    clear_actions
+    clear_actions,
+    shutdown_action_workers,
 )
 
 __all__ = [
     "compose_action_prompt",
+    "compile_prompt",
+    "render_prompt",
     "get_actions",
     "add_to_action_history",
     "get_action_history",
@@ -31,5 +36,6 @@ __all__ = [
     "get_action",
     "remove_action",
     "import_actions",
-    "clear_actions"
+    "clear_actions",
+    "shutdown_action_workers",
 ]
@@ -1,7 +1,13 @@
 import os
 import importlib
 import json
+import pickle
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from string import Formatter
 
 from agentmemory import (
     create_memory,
@@ -16,6 +22,108 @@ from agentlogger import log
 # Create an empty dictionary to hold the actions
 actions = {}
 
+# Memoized builder outputs, keyed by builder function
+builder_caches = {}
+
+# Maximum number of memoized prompts kept per builder
+BUILDER_CACHE_SIZE = 128
+
+# Where each imported action came from, as (actions_dir, module_name)
+action_modules = {}
+
+# Valid values for an action's "execution" key
+EXECUTION_TARGETS = ("inline", "thread", "process")
+
+# Shared worker pools, created on first use
+thread_pool = None
+process_pool = None
+
+# Guards creating, replacing and shutting down the shared pools
+pool_lock = threading.Lock()
+
+# Handlers loaded inside a process worker, keyed by action name
+worker_handlers = {}
+
+
+def compile_prompt(prompt):
+    """
+    Parse a str.format-style prompt into a compiled template.
+    add_action stores the result on the action as "compiled_prompt",
+    so each action's prompt is only parsed once.
+
+    Args:
+        prompt: The prompt template string, e.g. "Hello {name}"
+
+    Returns:
+        A dictionary with the template "parts" and its "placeholders".
+        Parts are (literal, field) tuples, field is None for trailing text.
+        If any field uses indexing, conversion or a format spec, "simple"
+        is False and substitution falls back to str.format_map.
+    """
+    parts = []
+    placeholders = []
+    simple = True
+    for literal, field, format_spec, conversion in Formatter().parse(prompt):
+        # Formatter.parse already unescapes doubled braces in the literal text
+        if field is None:
+            parts.append((literal, None))
+            continue
+        if field == "" or not field.isidentifier() or format_spec or conversion:
+            simple = False
+        parts.append((literal, field))
+        if field not in placeholders:
+            placeholders.append(field)
+
+    return {
+        "prompt": prompt,
+        "parts": parts,
+        "placeholders": tuple(placeholders),
+        "simple": simple,
+    }
+
+
+def render_prompt(template, values):
+    """
+    Substitute values into a compiled template.
+
+    Args:
+        template: A compiled template returned by compile_prompt
+        values: A dictionary of values to insert into the prompt
+
+    Returns:
+        A string representing the rendered prompt.
+    """
+    if not template["simple"]:
+        return template["prompt"].format_map(values)
+    return "".join(
+        [
+            literal if field is None else literal + str(values[field])
+            for literal, field in template["parts"]
+        ]
+    )
+
+
+def get_builder_cache_key(action, values):
+    """
+    Build a hashable cache key from the values an action's builder uses.
+    Builders are arbitrary code, so all values are used unless the action
+    lists the relevant ones in "memoize_keys".
+
+    Args:
+        action: Dict representing an action.
+        values: A dictionary of values passed to the builder
+
+    Returns:
+        A string key, or None if the values cannot be serialized.
+    """
+    keys = action.get("memoize_keys", None)
+    if keys is not None:
+        values = {key: values.get(key, None) for key in keys}
+    try:
+        return json.dumps(values, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
 
 def compose_action_prompt(action, values):
     """
@@ -26,6 +134,8 @@ def compose_action_prompt(action, values):
             This action contains a 'prompt' and 'builder' key
             The prompt is a string template
             The builder is a function which injects data into the template
+            If 'template' is True, the prompt is substituted directly
+            If 'memoize' is True, builder output is cached by value
         values: A dictionary of values to insert into the prompt
 
     Returns:
@@ -33,8 +143,30 @@ def compose_action_prompt(action, values):
     """
     prompt = action["prompt"]
     builder = action.get("builder", None)
-    if builder is not None:
-        prompt = builder(values)
+    if builder is None:
+        if action.get("template", False):
+            template = action.get("compiled_prompt", None)
+            if template is None or template["prompt"] != prompt:
+                template = compile_prompt(prompt)
+            prompt = render_prompt(template, values)
+        return prompt
+
+    if not action.get("memoize", False):
+        return builder(values)
+
+    key = get_builder_cache_key(action, values)
+    if key is None:
+        return builder(values)
+
+    cache = builder_caches.setdefault(builder, OrderedDict())
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    prompt = builder(values)
+    cache[key] = prompt
+    if len(cache) > BUILDER_CACHE_SIZE:
+        cache.popitem(last=False)
     return prompt
 
 
@@ -162,6 +294,9 @@ def search_actions(search_text, n_results=5):
 def use_action(function_name, arguments):
     """
     Execute a specific action by its function name.
+    "thread" actions run in a shared thread pool and "process" actions in a
+    shared process pool. If the action sets "timeout" (seconds), the call
+    stops waiting after that long and returns an error.
 
     Arguments:
     function_name (str): The name of the action's function to execute.
@@ -178,21 +313,241 @@ def use_action(function_name, arguments):
         return {"success": False, "output": None, "error": "Action not found"}
 
     add_to_action_history(function_name, arguments)
-    return actions[function_name]["handler"](arguments)
+    action = actions[function_name]
+    execution = action.get("execution", "inline")
+    if execution == "thread":
+        return use_action_in_thread(function_name, action, arguments)
+    if execution == "process":
+        return use_action_in_process(function_name, action, arguments)
+    return action["handler"](arguments)
+
+
+def get_thread_pool():
+    """
+    Retrieve the shared thread pool for "thread" actions, creating it if needed.
+
+    Returns:
+    ThreadPoolExecutor: The shared thread pool.
+    """
+    global thread_pool
+    with pool_lock:
+        if thread_pool is None:
+            thread_pool = ThreadPoolExecutor(thread_name_prefix="agentaction")
+        return thread_pool
+
+
+def submit_to_process_pool(fn, *args):
+    """
+    Submit a call to the shared process pool, creating the pool if needed.
+    Submitting under the pool lock keeps another thread from shutting the
+    pool down in between.
+    Each worker imports the known action modules once when it starts.
+
+    Returns:
+    tuple: The pool the call was submitted to, and its future.
+    """
+    global process_pool
+    with pool_lock:
+        if process_pool is None:
+            process_pool = ProcessPoolExecutor(
+                initializer=init_action_worker,
+                initargs=(sorted(set(action_modules.values())),),
+            )
+        return process_pool, process_pool.submit(fn, *args)
 
 
-def add_action(name, action):
+def reset_process_pool(pool=None, kill=False):
+    """
+    Drop the shared process pool so the next "process" action starts a new one.
+    Running calls on the old pool are allowed to finish, unless kill is set.
+
+    Arguments:
+    pool (ProcessPoolExecutor): Only reset if this is still the shared pool.
+        If None, the current pool is always reset.
+    kill (bool): Kill the old pool's workers, failing any calls still on it.
+
+    Returns:
+    None
+    """
+    global process_pool
+    with pool_lock:
+        if process_pool is None or (pool is not None and pool is not process_pool):
+            return
+        pool = process_pool
+        process_pool = None
+    if kill:
+        # ProcessPoolExecutor has no public way to stop a running task
+        for process in list((pool._processes or {}).values()):
+            process.kill()
+    pool.shutdown(wait=False)
+
+
+def shutdown_action_workers():
+    """
+    Shut down the shared thread and process pools.
+    They will be recreated the next time an action needs them.
+
+    Returns:
+    None
+    """
+    global thread_pool, process_pool
+    with pool_lock:
+        pools = [thread_pool, process_pool]
+        thread_pool = None
+        process_pool = None
+    for pool in pools:
+        if pool is not None:
+            pool.shutdown()
+
+
+def load_action_module(actions_dir, module_name):
+    """
+    Import an action module inside a process worker and register its handlers.
+
+    Arguments:
+    actions_dir (str): The directory containing the module.
+    module_name (str): The module name, without .py
+
+    Returns:
+    None
+    """
+    sys.path.insert(0, actions_dir)
+    try:
+        module = importlib.import_module(module_name)
+    finally:
+        sys.path.remove(actions_dir)
+    if hasattr(module, "get_actions"):
+        for action in module.get_actions():
+            worker_handlers[action["function"]["name"]] = action["handler"]
+
+
+def init_action_worker(modules):
+    """
+    Process pool initializer, imports all action modules once per worker.
+
+    Arguments:
+    modules (list): A list of (actions_dir, module_name) tuples.
+
+    Returns:
+    None
+    """
+    for actions_dir, module_name in modules:
+        # A broken module should only fail the actions that come from it
+        try:
+            load_action_module(actions_dir, module_name)
+        except Exception as e:
+            log(f"Warning: could not import {module_name}: {e}", type="warning")
+
+
+def run_action_in_worker(function_name, module, handler, arguments):
+    """
+    Run an action handler inside a process worker.
+    Imported actions are looked up by name, so only the name and arguments
+    cross the process boundary. Other actions send their handler, which must
+    be a picklable module-level function, and that handler is always used.
+
+    Returns:
+    The output of the action's handler.
+    """
+    if handler is None:
+        if function_name not in worker_handlers:
+            load_action_module(*module)
+        handler = worker_handlers[function_name]
+    return handler(arguments)
+
+
+def use_action_in_thread(function_name, action, arguments):
+    """
+    Execute an action in the shared thread pool.
+    This is meant for I/O-bound handlers: the handler still holds the GIL
+    while running Python code, but the caller can give up after "timeout".
+
+    Returns:
+    dict: The handler's output, or an error dict if the call timed out.
+    """
+    future = get_thread_pool().submit(action["handler"], arguments)
+    try:
+        return future.result(timeout=action.get("timeout", None))
+    except TimeoutError:
+        log("Warning: action timed out: " + function_name, type="warning")
+        return {"success": False, "output": None, "error": "Action timed out"}
+
+
+def use_action_in_process(function_name, action, arguments):
+    """
+    Execute an action in the shared process pool.
+    If a worker dies, the pool is replaced and the call fails without
+    taking down the calling process. If the call times out, the pool's
+    workers are killed so the abandoned task does not hold a worker,
+    and other calls still running on that pool fail as crashed.
+
+    Returns:
+    dict: The handler's output, or an error dict if the worker crashed
+        or the call timed out.
+    """
+    module = action_modules.get(function_name, None)
+    handler = None if module is not None else action["handler"]
+    pool = None
+    try:
+        pool, future = submit_to_process_pool(
+            run_action_in_worker, function_name, module, handler, arguments
+        )
+        return future.result(timeout=action.get("timeout", None))
+    except TimeoutError:
+        log("Warning: action timed out: " + function_name, type="warning")
+        reset_process_pool(pool, kill=True)
+        return {"success": False, "output": None, "error": "Action timed out"}
+    except BrokenProcessPool:
+        log("Warning: action worker crashed: " + function_name, type="warning")
+        reset_process_pool(pool)
+        return {"success": False, "output": None, "error": "Action worker crashed"}
+
+
+def add_action(name, action, module=None):
     """
     Add an action to the actions dictionary and 'actions' collection in memory.
+    If the action sets "template", its prompt is compiled once here.
+    The optional "execution" key selects where the handler runs:
+    "inline" (default), "thread" or "process".
 
     Arguments:
     name (str): The name of the action.
     action (dict): The action data to be added.
+    module (tuple): The (actions_dir, module_name) the action was imported
+        from, if any. Process workers import it instead of pickling the handler.
 
     Returns:
     None
     """
+    execution = action.get("execution", "inline")
+    if execution not in EXECUTION_TARGETS:
+        raise ValueError(f"Unknown execution target for {name}: {execution}")
+    if execution == "process" and module is None:
+        try:
+            pickle.dumps(action["handler"])
+        except (pickle.PicklingError, AttributeError, TypeError):
+            raise ValueError(
+                f"Handler for process action {name} must be a module-level function"
+            )
+    old_action = actions.get(name, None)
+    if old_action is not None and "process" in (
+        execution,
+        old_action.get("execution", "inline"),
+    ):
+        # Workers may still hold the old handler for this name. Imported
+        # actions are loaded by name, so only a different module matters.
+        old_module = action_modules.get(name, None)
+        if old_module != module or (
+            module is None and old_action["handler"] is not action["handler"]
+        ):
+            reset_process_pool()
     actions[name] = action
+    if module is None:
+        action_modules.pop(name, None)
+    else:
+        action_modules[name] = module
+    if action.get("template", False):
+        action["compiled_prompt"] = compile_prompt(action["prompt"])
     create_memory(
         "actions",
         f"{name} - {action['function']['description']}",
@@ -228,6 +583,8 @@ def remove_action(name):
     """
     if name in actions:
         del actions[name]
+        action_modules.pop(name, None)
+        reset_process_pool()
         delete_memory("actions", name)
         return True
     return False
@@ -256,7 +613,7 @@ def import_actions(actions_dir):
 
                 for i in range(len(action_funcs)):
                     name = action_funcs[i]["function"]["name"]
-                    add_action(name, action_funcs[i])
+                    add_action(name, action_funcs[i], (actions_dir, module_name))
     # Remove the added path after done with imports
     sys.path.remove(actions_dir)
 
@@ -271,6 +628,9 @@ def clear_actions():
     wipe_category("actions")
     global actions
     actions = {}
+    builder_caches.clear()
+    action_modules.clear()
+    reset_process_pool()
 
 
 def get_formatted_actions(search_text):
@@ -1,7 +1,13 @@
 import os
 import shutil
+import threading
+import time
+
+import pytest
 
 from agentaction import (
+    compose_action_prompt,
+    compile_prompt,
     add_to_action_history,
     get_action_history,
     get_last_action,
@@ -15,9 +21,11 @@ from agentaction import (
     import_actions,
     clear_actions,
     get_actions,
+    shutdown_action_workers,
 )
 from agentmemory import wipe_all_memories
 
+import agentaction.main
 from agentaction.main import get_formatted_actions
 
 
@@ -296,3 +304,197 @@ def test_get_formatted_actions_no_actions():
     assert result["short_actions"].strip() == "Available actions (name):"
 
     cleanup()  # Cleanup after the test
+
+
+def test_compose_action_prompt_template():
+    action = {"prompt": "Hello {name}, {{literal}} {count:>3}", "template": True}
+    template = compile_prompt(action["prompt"])
+    assert template["placeholders"] == ("name", "count")
+    action["compiled_prompt"] = template  # As stored by add_action
+
+    prompt = compose_action_prompt(action, {"name": "agent", "count": 7})
+    assert prompt == "Hello agent, {literal}   7"
+
+    # Without "template" the prompt is returned untouched
+    assert compose_action_prompt({"prompt": "Hi {name}"}, {}) == "Hi {name}"
+
+
+def test_compose_action_prompt_memoize():
+    calls = []
+
+    def builder(values):
+        calls.append(values)
+        return "Hello " + values["name"]
+
+    action = {
+        "prompt": "Hello {name}",
+        "builder": builder,
+        "memoize": True,
+        "memoize_keys": ["name"],
+    }
+    assert compose_action_prompt(action, {"name": "a", "noise": 1}) == "Hello a"
+    assert compose_action_prompt(action, {"name": "a", "noise": 2}) == "Hello a"
+    assert len(calls) == 1  # Second call came from the cache
+    assert compose_action_prompt(action, {"name": "b"}) == "Hello b"
+    assert len(calls) == 2
+
+    # Without memoize_keys, builders are keyed on all values
+    action = {
+        "prompt": "Hi {name}",
+        "template": True,
+        "builder": lambda values: "Hi " + values["name"] + values["extra"],
+        "memoize": True,
+    }
+    assert compose_action_prompt(action, {"name": "x", "extra": "1"}) == "Hi x1"
+    assert compose_action_prompt(action, {"name": "x", "extra": "2"}) == "Hi x2"
+
+
+def process_test_handler(args):
+    return {
+        "success": True,
+        "output": (os.getpid(), threading.current_thread().name),
+    }
+
+
+def other_process_test_handler(args):
+    return {"success": True, "output": "other"}
+
+
+def crashing_test_handler(args):
+    os._exit(1)
+
+
+def slow_test_handler(args):
+    time.sleep(3)
+    return {"success": True, "output": "slow"}
+
+
+def test_use_action_execution_targets():
+    cleanup()  # Ensure clean state before test
+    for execution in ["inline", "thread", "process"]:
+        test_action = setup_test_action()
+        test_action["execution"] = execution
+        test_action["handler"] = process_test_handler
+        add_action("test", test_action)
+        result = use_action("test", {"input": "test"})
+        assert result["success"]
+        pid, thread_name = result["output"]
+        # Only process actions run outside of this process
+        assert (pid != os.getpid()) == (execution == "process")
+        # Only thread actions run in the shared thread pool
+        assert thread_name.startswith("agentaction") == (execution == "thread")
+    shutdown_action_workers()
+    cleanup()  # Cleanup after the test
+
+
+def test_add_action_process_validation():
+    cleanup()  # Ensure clean state before test
+    test_action = setup_test_action()
+    test_action["execution"] = "process"  # Handler is a lambda
+    with pytest.raises(ValueError):
+        add_action("invalid", test_action)
+    assert get_action("invalid") is None
+
+    test_action["execution"] = "elsewhere"
+    with pytest.raises(ValueError):
+        add_action("invalid", test_action)
+    assert get_action("invalid") is None
+    cleanup()  # Cleanup after the test
+
+
+def test_use_action_process_reregister():
+    cleanup()  # Ensure clean state before test
+    test_action = setup_test_action()
+    test_action["execution"] = "process"
+    test_action["handler"] = process_test_handler
+    add_action("test", test_action)
+    assert use_action("test", {"input": "test"})["success"]
+
+    # Re-registering a name must not run the old handler
+    test_action = setup_test_action()
+    test_action["execution"] = "process"
+    test_action["handler"] = other_process_test_handler
+    add_action("test", test_action)
+    assert use_action("test", {"input": "test"})["output"] == "other"
+    shutdown_action_workers()
+    cleanup()  # Cleanup after the test
+
+
+def test_use_action_process_crash():
+    cleanup()  # Ensure clean state before test
+    test_action = setup_test_action()
+    test_action["execution"] = "process"
+    test_action["handler"] = crashing_test_handler
+    add_action("crash", test_action)
+    result = use_action("crash", {"input": "test"})
+    assert not result["success"]  # Crash is reported, not raised
+
+    # The pool is respawned for the next call
+    test_action = setup_test_action()
+    test_action["execution"] = "process"
+    test_action["handler"] = process_test_handler
+    add_action("test", test_action)
+    assert use_action("test", {"input": "test"})["success"]
+    shutdown_action_workers()
+    cleanup()  # Cleanup after the test
+
+
+def test_import_actions_process():
+    cleanup()  # Ensure clean state before test
+    if os.path.exists(TEST_DIR):
+        shutil.rmtree(TEST_DIR)
+    os.mkdir(TEST_DIR)
+    with open(os.path.join(TEST_DIR, "process_actions.py"), "w") as f:
+        f.write(
+            """import os
+
+
+def get_actions():
+    return [
+        {
+            "function": {"name": "process_pid", "description": "A test action"},
+            "suggestion_after_actions": [],
+            "never_after_actions": [],
+            "execution": "process",
+            "handler": lambda args: {"success": True, "output": os.getpid()},
+        }
+    ]
+"""
+        )
+
+    import_actions(TEST_DIR)  # The handler is a lambda, loaded by name
+    result = use_action("process_pid", {})
+    assert result["success"] and result["output"] != os.getpid()
+
+    # Re-importing an unchanged directory keeps the warm workers
+    pool = agentaction.main.process_pool
+    import_actions(TEST_DIR)
+    assert agentaction.main.process_pool is pool
+    assert use_action("process_pid", {})["success"]
+
+    shutdown_action_workers()
+    teardown_test_directory()  # Cleanup the test directory
+    cleanup()  # Cleanup after the test
+
+
+def test_use_action_timeout():
+    cleanup()  # Ensure clean state before test
+    for execution in ["thread", "process"]:
+        test_action = setup_test_action()
+        test_action["execution"] = execution
+        test_action["timeout"] = 0.5
+        test_action["handler"] = slow_test_handler
+        add_action("slow", test_action)
+        result = use_action("slow", {})
+        assert not result["success"] and result["error"] == "Action timed out"
+
+        # Later calls are not stuck behind the timed out task
+        test_action = setup_test_action()
+        test_action["execution"] = execution
+        test_action["handler"] = process_test_handler
+        add_action("fast", test_action)
+        start = time.time()
+        assert use_action("fast", {})["success"]
+        assert time.time() - start < 2
+    shutdown_action_workers()
+    cleanup()  # Cleanup after the test